@@ -7,8 +7,33 @@ src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, project_root)
 sys.path.insert(0, src_path)
 
-from src.app.main import app
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+
+    # Use uvloop + httptools when available (uvloop is not supported on Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    # Auto-reload only in development (DEV=1); watchfiles is used when installed.
+    # Keep a single worker: runtime config is held in process memory.
+    reload = os.getenv("DEV", "0") == "1"
+
+    uvicorn.run(
+        "src.app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        reload_dirs=[src_path] if reload else None,
+        app_dir=project_root,
+        loop=loop,
+        http=http,
+        log_level="info"
+    )
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, NamedTuple
+from types import MappingProxyType
 from pydantic import BaseModel, Field, validator
-import json
-import os
+from ..core import get_ai_service
+from ..utils.config_manager import ConfigManager
 
 router = APIRouter(prefix="/config", tags=["Configuration"])
 
@@ -46,15 +47,7 @@ class ConfigResponse(BaseModel):
     templates: Dict[str, Any] = {}
 
 # Load models from config file
-def load_models_config():
-    config_path = os.path.join(os.path.dirname(__file__), "..", "config", "models.json")
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except:
-        return {}
-
-models_config = load_models_config()
+models_config = ConfigManager.load_models_config()
 
 # In-memory config storage (replace with database in production)
 current_config = {
@@ -64,78 +57,139 @@ current_config = {
     "tts_parameters": TTSParameters()
 }
 
-# Configuration templates
-def get_config_templates():
-    return {
-        "text_only_basic": {
-            "model": "gpt-3.5-turbo",
-            "system_prompt": "You are a helpful assistant.",
-            "model_parameters": {
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "max_tokens": 100
-            }
-        },
-        "text_only_creative": {
-            "model": "gpt-4o",
-            "system_prompt": "You are a creative writing assistant.",
-            "model_parameters": {
-                "temperature": 1.2,
-                "top_p": 0.95,
-                "max_tokens": 500
-            }
-        },
-        "text_only_technical": {
-            "model": "gpt-4o",
-            "system_prompt": "You are a technical expert and programming assistant.",
-            "model_parameters": {
-                "temperature": 0.3,
-                "top_p": 0.8,
-                "max_tokens": 1000
-            }
-        },
-        "tts_only_basic": {
-            "tts_parameters": {
-                "voice": "alloy",
-                "speed": 1.0,
-                "provider": "openai"
-            }
-        },
-        "tts_only_expressive": {
-            "tts_parameters": {
-                "voice": "nova",
-                "speed": 1.1,
-                "provider": "openai"
-            }
-        },
-        "tts_only_formal": {
-            "tts_parameters": {
-                "voice": "echo",
-                "speed": 0.9,
-                "provider": "openai"
-            }
+class TTSDefaults(NamedTuple):
+    """Flattened TTS defaults read by the /tts handler"""
+    voice: str
+    speed: float
+    provider: str
+
+def _build_tts_defaults(tts_params: Any) -> TTSDefaults:
+    """Normalize tts_parameters (Pydantic object or dict) into TTSDefaults"""
+    if hasattr(tts_params, 'voice'):
+        return TTSDefaults(tts_params.voice, tts_params.speed, tts_params.provider)
+    if isinstance(tts_params, dict):
+        return TTSDefaults(
+            tts_params.get('voice', "alloy"),
+            tts_params.get('speed', 1.0),
+            tts_params.get('provider', "openai")
+        )
+    return TTSDefaults("alloy", 1.0, "openai")
+
+# Rebuilt whenever current_config["tts_parameters"] changes
+_tts_defaults = _build_tts_defaults(current_config["tts_parameters"])
+
+def get_tts_defaults() -> TTSDefaults:
+    return _tts_defaults
+
+# Bumped on every config update; the formatted GET /config payload is cached per version
+_config_version = 0
+_cached_formatted = (None, -1)
+
+# Static sections of the formatted GET /config response
+_QUICK_TEMPLATES = {
+    "💡 How to Use": "Choose a template below, or create custom settings",
+    "📝 Text Only": {
+        "basic": "Simple assistant (temp=0.7, 100 tokens)",
+        "creative": "Creative writing (temp=1.2, 500 tokens)",
+        "technical": "Programming help (temp=0.3, 1000 tokens)"
+    },
+    "🎵 Speech Only": {
+        "basic": "Standard voice (alloy, 1.0x speed)",
+        "expressive": "Lively voice (nova, 1.1x speed)",
+        "formal": "Professional voice (echo, 0.9x speed)"
+    },
+    "🎯 Complete Setup": "Full configuration with both text + speech"
+}
+
+_INSTRUCTIONS = {
+    "📋 How to Update": {
+        "1️⃣ Change Model": "POST /config/ with {'model': 'gpt-4o'}",
+        "2️⃣ Change Settings": "POST /config/ with {'model_parameters': {...}}",
+        "3️⃣ Change Voice": "POST /config/ with {'tts_parameters': {...}}",
+        "4️⃣ Use Template": "GET /config/templates, then POST the template data"
+    },
+    "💡 Pro Tips": {
+        "🌡️ Temperature": "Lower = more focused, Higher = more creative",
+        "🎯 Top-P": "0.9 = balanced, 0.8 = focused, 0.95 = diverse",
+        "📝 Tokens": "1 token ≈ 0.75 words in English",
+        "⚡ Speed": "1.0 = normal, 0.5 = slow, 2.0 = fast"
+    }
+}
+
+# Configuration templates (static, shared by every response)
+_CONFIG_TEMPLATES = MappingProxyType({
+    "text_only_basic": {
+        "model": "gpt-3.5-turbo",
+        "system_prompt": "You are a helpful assistant.",
+        "model_parameters": {
+            "temperature": 0.7,
+            "top_p": 0.9,
+            "max_tokens": 100
+        }
+    },
+    "text_only_creative": {
+        "model": "gpt-4o",
+        "system_prompt": "You are a creative writing assistant.",
+        "model_parameters": {
+            "temperature": 1.2,
+            "top_p": 0.95,
+            "max_tokens": 500
+        }
+    },
+    "text_only_technical": {
+        "model": "gpt-4o",
+        "system_prompt": "You are a technical expert and programming assistant.",
+        "model_parameters": {
+            "temperature": 0.3,
+            "top_p": 0.8,
+            "max_tokens": 1000
+        }
+    },
+    "tts_only_basic": {
+        "tts_parameters": {
+            "voice": "alloy",
+            "speed": 1.0,
+            "provider": "openai"
+        }
+    },
+    "tts_only_expressive": {
+        "tts_parameters": {
+            "voice": "nova",
+            "speed": 1.1,
+            "provider": "openai"
+        }
+    },
+    "tts_only_formal": {
+        "tts_parameters": {
+            "voice": "echo",
+            "speed": 0.9,
+            "provider": "openai"
+        }
+    },
+    "complete_config": {
+        "model": "gpt-3.5-turbo",
+        "system_prompt": "You are a helpful assistant.",
+        "model_parameters": {
+            "temperature": 0.7,
+            "top_p": 0.9,
+            "max_tokens": 100
         },
-        "complete_config": {
-            "model": "gpt-3.5-turbo",
-            "system_prompt": "You are a helpful assistant.",
-            "model_parameters": {
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "max_tokens": 100
-            },
-            "tts_parameters": {
-                "voice": "alloy",
-                "speed": 1.0,
-                "provider": "openai"
-            }
+        "tts_parameters": {
+            "voice": "alloy",
+            "speed": 1.0,
+            "provider": "openai"
         }
     }
+})
+
+def get_config_templates():
+    return _CONFIG_TEMPLATES
 
 @router.post("/", response_model=ConfigResponse)
 async def update_config(request: ConfigRequest):
     """Cập nhật cấu hình model và parameters"""
     try:
-        global current_config
+        global current_config, _config_version, _tts_defaults
 
         # Update config with new values (only if provided)
         if request.model is not None:
@@ -151,10 +205,12 @@ async def update_config(request: ConfigRequest):
         # Update TTS parameters if provided
         if request.tts_parameters:
             current_config["tts_parameters"] = request.tts_parameters
+            _tts_defaults = _build_tts_defaults(request.tts_parameters)
+
+        # Invalidate the cached formatted config
+        _config_version += 1
 
-        # Import AI service to get available models
-        from ..core import ai_service
-        available_models = ai_service.get_available_models()
+        available_models = get_ai_service().get_available_models()
 
         return ConfigResponse(
             model=current_config["model"],
@@ -169,11 +225,15 @@ async def update_config(request: ConfigRequest):
 
 def format_config_for_user():
     """Format configuration data for better user readability"""
+    global _cached_formatted
+
+    if _cached_formatted[1] == _config_version:
+        return _cached_formatted[0]
+
     try:
-        from ..core import ai_service
-        available_models = ai_service.get_available_models()
+        available_models = get_ai_service().get_available_models()
 
-        return {
+        formatted = {
             "current_configuration": {
                 "📄 Model Being Used": current_config["model"],
                 "💬 System Prompt": current_config["system_prompt"][:100] + "..." if len(current_config["system_prompt"]) > 100 else current_config["system_prompt"],
@@ -190,42 +250,18 @@ def format_config_for_user():
             },
             "available_options": {
                 "📚 Text Generation Models": {
-                    "🟢 Google Gemini": list(available_models.get("text_generation", {}).get("gemini", {}).keys())
+                    "🟢 Google Gemini": list(available_models.get("text_generation", []))
                 },
                 "🎵 Text-to-Speech Options": {
                     "🔴 OpenAI Voices": available_models.get("voices", {}).get("openai_voices", []),
                     "🟢 Google Languages": available_models.get("voices", {}).get("google_languages", [])[:8]  # Show first 8
                 }
             },
-            "quick_templates": {
-                "💡 How to Use": "Choose a template below, or create custom settings",
-                "📝 Text Only": {
-                    "basic": "Simple assistant (temp=0.7, 100 tokens)",
-                    "creative": "Creative writing (temp=1.2, 500 tokens)",
-                    "technical": "Programming help (temp=0.3, 1000 tokens)"
-                },
-                "🎵 Speech Only": {
-                    "basic": "Standard voice (alloy, 1.0x speed)",
-                    "expressive": "Lively voice (nova, 1.1x speed)",
-                    "formal": "Professional voice (echo, 0.9x speed)"
-                },
-                "🎯 Complete Setup": "Full configuration with both text + speech"
-            },
-            "instructions": {
-                "📋 How to Update": {
-                    "1️⃣ Change Model": "POST /config/ with {'model': 'gpt-4o'}",
-                    "2️⃣ Change Settings": "POST /config/ with {'model_parameters': {...}}",
-                    "3️⃣ Change Voice": "POST /config/ with {'tts_parameters': {...}}",
-                    "4️⃣ Use Template": "GET /config/templates, then POST the template data"
-                },
-                "💡 Pro Tips": {
-                    "🌡️ Temperature": "Lower = more focused, Higher = more creative",
-                    "🎯 Top-P": "0.9 = balanced, 0.8 = focused, 0.95 = diverse",
-                    "📝 Tokens": "1 token ≈ 0.75 words in English",
-                    "⚡ Speed": "1.0 = normal, 0.5 = slow, 2.0 = fast"
-                }
-            }
+            "quick_templates": _QUICK_TEMPLATES,
+            "instructions": _INSTRUCTIONS
         }
+        _cached_formatted = (formatted, _config_version)
+        return formatted
     except Exception as e:
         return {"error": f"Configuration formatting failed: {str(e)}"}
 
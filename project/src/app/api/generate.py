@@ -1,14 +1,82 @@
-from fastapi import APIRouter, Form, File, UploadFile
+from fastapi import APIRouter, Form, File, UploadFile, Header, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List
+from typing import List, Dict, Any, Tuple, Optional
+import asyncio
+import tempfile
+import os
+import shutil
+import mimetypes
+import logging
+
+from ..core import get_ai_service
+from ..utils.config_manager import ConfigManager
+from ..utils.ttl_cache import TTLCache, generation_cache_key
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/generate", tags=["Text Generation"])
 
+# Common upload types, checked before falling back to the mimetypes registry
+_MIME_MAP = {
+    'pdf': 'application/pdf',
+    'txt': 'text/plain',
+    'csv': 'text/csv',
+    'md': 'text/markdown',
+    'json': 'application/json',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+    'doc': 'application/msword',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+}
+
+# Exact-match cache for deterministic (temperature == 0) text-only generations
+_response_cache = TTLCache(maxsize=256, ttl=600)
+
 class GenerateResponse(BaseModel):
     response: str
 
+def _copy_to_temp_file(source, suffix: str) -> Tuple[str, int]:
+    """Copy a file object into a new temporary file in 64KB chunks, returns (path, size)"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        shutil.copyfileobj(source, temp_file, 64 * 1024)
+        return temp_file.name, temp_file.tell()
+
+def _remove_temp_files(paths: List[str]) -> None:
+    """Delete temporary upload files, ignoring ones that are already gone"""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+async def _save_upload(file: UploadFile) -> Dict[str, Any]:
+    """Copy one upload into a temporary file and describe it for the AI service"""
+    # Create, fill and close the temp file off the event loop
+    suffix = os.path.splitext(file.filename)[1]
+    temp_path, file_size = await run_in_threadpool(_copy_to_temp_file, file.file, suffix)
+
+    # Get MIME type
+    mime_type = (
+        _MIME_MAP.get(suffix[1:].lower()) or
+        mimetypes.guess_type(file.filename)[0] or
+        file.content_type or
+        'application/octet-stream'
+    )
+
+    return {
+        'filename': file.filename,
+        'file_path': temp_path,
+        'mime_type': mime_type,
+        'size': file_size
+    }
+
 @router.post("/text")
 async def generate_text(
+    background_tasks: BackgroundTasks,
     prompt: str = Form(..., description="Text prompt for generation"),
     max_tokens: int = Form(default=100, description="Maximum tokens to generate"),
     model: str = Form(default="gemini-2.0-flash-exp", description="Model to use"),
@@ -16,53 +84,43 @@ async def generate_text(
     custom_system_prompt: str = Form(default="", description="Custom system prompt text"),
     temperature: float = Form(default=0.7, description="Temperature (0.0-2.0)"),
     top_p: float = Form(default=0.9, description="Top-p (0.0-1.0)"),
-    files: List[UploadFile] = File(default=[], description="Optional files to include in the prompt")
+    files: List[UploadFile] = File(default=[], description="Optional files to include in the prompt"),
+    x_no_cache: Optional[str] = Header(default=None, description="Set to bypass the response cache")
 ):
     """Generate text từ prompt"""
     try:
-        # Import services
-        from ..core import ai_service
-        from ..utils.config_manager import ConfigManager
-        # Removed cache_manager import as caching is now disabled
-
-        # Get system prompt text using ConfigManager
+        # Get system prompt text (ConfigManager caches models.json per mtime)
         if system_prompt == 'custom' and custom_system_prompt.strip():
             system_prompt_text = custom_system_prompt.strip()
         else:
-            system_prompts = ConfigManager.get_system_prompts("default")
+            system_prompts = ConfigManager.get_system_prompts()
             system_prompt_text = system_prompts.get(system_prompt,
                 "You are a helpful AI assistant. Please provide accurate and helpful responses to user queries.")
 
-        # Process uploaded files
+        # Serve repeated deterministic text-only requests from the cache
+        cache_key = None
+        if not files and temperature == 0 and not x_no_cache:
+            cache_key = generation_cache_key(prompt, model, system_prompt_text, temperature, top_p, max_tokens)
+            cached_text = _response_cache.get(cache_key)
+            if cached_text is not None:
+                return GenerateResponse(response=cached_text)
+
+        # Process uploaded files concurrently (order is preserved)
         processed_files = []
         if files:
-            import tempfile
-            import os
-            import mimetypes
-
-            for file in files:
-                if file.filename:
-                    # Create temporary file
-                    suffix = os.path.splitext(file.filename)[1]
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                        content = await file.read()
-                        temp_file.write(content)
-                        temp_path = temp_file.name
-
-                    # Get MIME type
-                    mime_type, _ = mimetypes.guess_type(file.filename)
-                    if not mime_type:
-                        mime_type = file.content_type or 'application/octet-stream'
-
-                    processed_files.append({
-                        'filename': file.filename,
-                        'file_path': temp_path,
-                        'mime_type': mime_type,
-                        'size': len(content)
-                    })
+            results = await asyncio.gather(
+                *(_save_upload(file) for file in files if file.filename),
+                return_exceptions=True
+            )
+            processed_files = [r for r in results if not isinstance(r, BaseException)]
+            # Delete the temp files after the response has been sent - even if another upload failed
+            background_tasks.add_task(_remove_temp_files, [f['file_path'] for f in processed_files])
+            for r in results:
+                if isinstance(r, BaseException):
+                    raise r
 
         # Generate text
-        result = await ai_service.generate_text_with_files(
+        result = await get_ai_service().generate_text_with_files(
             prompt=prompt,
             files=processed_files,
             model=model,
@@ -72,20 +130,14 @@ async def generate_text(
             max_tokens=max_tokens
         )
 
-        # Clean up temporary files
-        for file_info in processed_files:
-            try:
-                os.unlink(file_info['file_path'])
-            except:
-                pass
-
         if result["success"]:
             generated_text = result["generated_text"]
 
-            # ✨ Caching disabled - return response directly
-            print(f"✅ Text generation completed (caching disabled)")
-            print(f"   Content length: {len(generated_text)} chars")
-            
+            if cache_key:
+                _response_cache.set(cache_key, generated_text)
+
+            logger.debug("Text generation completed: %d chars", len(generated_text))
+
             return GenerateResponse(response=generated_text)
         else:
             return GenerateResponse(response=f"Error: {result.get('error', 'Unknown error')}")
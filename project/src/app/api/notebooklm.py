@@ -5,11 +5,14 @@ NotebookLM Automation API endpoint
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import os
 import sys
 import time
+import atexit
 import asyncio
+import hashlib
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
 # Add paths for imports
@@ -24,11 +27,57 @@ sys.path.append(automation_dir)
 sys.path.append(flow_dir)
 
 from automate import run_notebooklm_automation
+from ..utils.ttl_cache import TTLCache
 
 router = APIRouter()
 
+# Shared pool for browser automation - also bounds concurrent Playwright sessions
+_AUTOMATION_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nlm-auto")
+atexit.register(_AUTOMATION_POOL.shutdown, wait=False)
+
+# Successful automation results keyed by a hash of the submitted text
+_RESULT_CACHE = TTLCache(maxsize=32, ttl=600)
+
+# Windows-specific fix for subprocess - Playwright needs the Proactor loop in its worker threads
+if os.name == 'nt':
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+# Cached (True, browser path) once Playwright is found - failures are re-checked on every request
+_PLAYWRIGHT_READY: Optional[Tuple[bool, str]] = None
+_PLAYWRIGHT_LOCK = threading.Lock()
+
+def _check_playwright_once() -> Tuple[bool, str]:
+    """Check the Playwright Chromium install, caching only success (runs in a worker thread)"""
+    global _PLAYWRIGHT_READY
+
+    with _PLAYWRIGHT_LOCK:
+        if _PLAYWRIGHT_READY is not None:
+            return _PLAYWRIGHT_READY
+
+        try:
+            from playwright.sync_api import sync_playwright
+
+            print(f"🔍 Testing Playwright installation...")
+            with sync_playwright() as p:
+                browser_path = p.chromium.executable_path
+        except ImportError:
+            # Not cached - the user can install it without restarting the server
+            return False, "Playwright not installed. Please run: pip install playwright && playwright install chromium"
+        except Exception as e:
+            # Possibly transient - don't cache, retry on the next request
+            print(f"❌ Playwright error: {e}")
+            return False, f"Playwright setup issue: {e}"
+
+        if not browser_path or not os.path.exists(browser_path):
+            return False, "Playwright Chromium browser not found. Please run: playwright install chromium"
+
+        print(f"✅ Playwright Chromium found at: {browser_path}")
+        _PLAYWRIGHT_READY = (True, browser_path)
+        return _PLAYWRIGHT_READY
+
 class NotebookLMRequest(BaseModel):
     custom_text: str  # Required custom text input
+    force: bool = False  # Re-run the automation even if this text was processed recently
 
 class NotebookLMResponse(BaseModel):
     success: bool
@@ -58,6 +107,14 @@ async def generate_audio_from_text(request: NotebookLMRequest):
         custom_text = request.custom_text.strip()
         print(f"🚀 Using custom text for NotebookLM (length: {len(custom_text)} chars)")
         
+        # Return a recent successful run for the same text instead of re-running the browser
+        cache_key = hashlib.sha256(custom_text.encode('utf-8')).hexdigest()
+        if not request.force:
+            cached_response = _RESULT_CACHE.get(cache_key)
+            if cached_response is not None:
+                print(f"♻️ Returning cached NotebookLM result")
+                return cached_response
+
         text_info = {
             'source': 'custom_text',
             'content_length': len(custom_text),
@@ -69,35 +126,10 @@ async def generate_audio_from_text(request: NotebookLMRequest):
 
         def run_automation():
             try:
-                # Check Playwright availability first
-                try:
-                    from playwright.sync_api import sync_playwright
-                    import os
-                    import asyncio
-                    
-                    # Windows-specific fix for subprocess
-                    if os.name == 'nt':  # Windows
-                        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                    
-                    # Test Playwright installation properly
-                    print(f"🔍 Testing Playwright installation...")
-                    with sync_playwright() as p:
-                        browser_path = p.chromium.executable_path
-                        if not browser_path or not os.path.exists(browser_path):
-                            raise Exception("Playwright Chromium browser not found. Please run: playwright install chromium")
-                        print(f"✅ Playwright Chromium found at: {browser_path}")
-                except ImportError:
-                    raise Exception("Playwright not installed. Please run: pip install playwright && playwright install chromium")
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "not found" in error_msg or "chromium" in error_msg:
-                        raise e
-                    elif "target page" in error_msg or "browser has been closed" in error_msg:
-                        print(f"⚠️ Browser closed during automation: {e}")
-                        raise Exception(f"Browser automation interrupted: {e}")
-                    else:
-                        print(f"❌ Playwright error: {e}")
-                        raise Exception(f"Playwright setup issue: {e}")
+                # Check Playwright availability first (cached after the first run)
+                playwright_ready, playwright_detail = _check_playwright_once()
+                if not playwright_ready:
+                    raise Exception(playwright_detail)
                 
                 # Validate content length
                 if len(custom_text.strip()) < 50:
@@ -120,12 +152,11 @@ async def generate_audio_from_text(request: NotebookLMRequest):
                 return False
 
         # Execute in thread pool with timeout
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
-            with ThreadPoolExecutor() as executor:
-                future = loop.run_in_executor(executor, run_automation)
-                # Add a timeout to prevent hanging
-                success = await asyncio.wait_for(future, timeout=300)  # 5 minutes max
+            future = loop.run_in_executor(_AUTOMATION_POOL, run_automation)
+            # Add a timeout to prevent hanging
+            success = await asyncio.wait_for(future, timeout=300)  # 5 minutes max
         except asyncio.TimeoutError:
             print("❌ Automation timed out after 5 minutes")
             success = False
@@ -136,13 +167,15 @@ async def generate_audio_from_text(request: NotebookLMRequest):
             # Generate audio URL (simulated - in real implementation you'd track actual download)
             audio_url = f"/downloads/notebooklm_audio_{int(time.time())}.mp3"
             
-            return NotebookLMResponse(
+            response = NotebookLMResponse(
                 success=True,
                 message="Audio generation initiated successfully! Please check your Downloads folder and browser for the completed audio file.",
                 audio_url=audio_url,
                 text_info=text_info,
                 processing_time=processing_time
             )
+            _RESULT_CACHE.set(cache_key, response)
+            return response
         else:
             # Provide more helpful error message with setup instructions
             error_type = "Unknown automation error"
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
-import json
-import os
+from ..core import get_ai_service
+from ..utils.audio_utils import AudioUtils
+from ..utils.config_manager import ConfigManager
+from .config import get_tts_defaults
 
 router = APIRouter(prefix="/tts", tags=["Text to Speech"])
 
@@ -22,6 +24,8 @@ class TTSRequest(BaseModel):
     voice_config: Optional[Dict[str, Any]] = None  # For Gemini voice configuration
     # Google Cloud TTS specific
     language_code: Optional[str] = "en-US"  # For Google Cloud TTS
+    # Echo the configured voices in the response (off by default to keep responses small)
+    include_voices: bool = False
 
 class TTSResponse(BaseModel):
     success: bool
@@ -41,99 +45,85 @@ class TTSResponse(BaseModel):
     available_voices: Dict[str, Any] = {}
     error: str = ""
 
-# Load models from config file
-def load_models_config():
-    config_path = os.path.join(os.path.dirname(__file__), "..", "config", "models.json")
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except:
-        return {}
+def _resolve_tts_options(request: TTSRequest, models_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge request parameters with config defaults and apply the provider prompt rules"""
+    # Config defaults, normalized once per config update
+    defaults = get_tts_defaults()
+
+    # Use request parameters if provided, otherwise use config defaults
+    voice = request.voice or defaults.voice
+    speed = request.speed or defaults.speed
+    provider = request.provider or defaults.provider
+
+    # Handle system prompt for TTS
+    system_prompt = request.system_prompt
+    if not system_prompt and provider in ["gemini", "google"]:
+        # Use default TTS prompt if none provided for Gemini/Google
+        tts_prompts = models_config.get("system_prompts", {}).get("tts_prompts", {})
+        system_prompt = tts_prompts.get("default", "Read the text naturally with clear pronunciation")
+
+    # Apply system prompt logic based on provider
+    instructions = request.instructions
+    prompt_prefix = request.prompt_prefix
+
+    if provider == "openai":
+        # For OpenAI, use system_prompt as instructions if no instructions provided
+        if not instructions and system_prompt:
+            instructions = system_prompt
+    elif provider in ["gemini", "google"]:
+        # For Gemini, use system_prompt as prompt_prefix if no prompt_prefix provided
+        if not prompt_prefix and system_prompt:
+            prompt_prefix = system_prompt
 
-models_config = load_models_config()
+    return {
+        "voice": voice,
+        "speed": speed,
+        "provider": provider,
+        "model": request.model,
+        "system_prompt": system_prompt,
+        "instructions": instructions,
+        "prompt_prefix": prompt_prefix
+    }
+
+async def _synthesize(request: TTSRequest, options: Dict[str, Any], encode_base64: bool = True) -> Dict[str, Any]:
+    """Convert text to speech using AI service"""
+    return await get_ai_service().text_to_speech(
+        text=request.text,
+        voice=options["voice"],
+        speed=options["speed"],
+        provider=options["provider"],
+        model=options["model"],
+        instructions=options["instructions"],
+        voice_config=request.voice_config,
+        prompt_prefix=options["prompt_prefix"],
+        response_format=request.response_format,
+        encode_base64=encode_base64
+    )
 
 @router.post("/", response_model=TTSResponse)
 async def text_to_audio(request: TTSRequest):
     """Chuyển đổi text thành audio"""
     try:
-        # Import AI service and current config
-        from src.app.core import ai_service
-        from .config import current_config
-
-        # Get TTS parameters from config (handle both Pydantic object and dict)
-        tts_params = current_config.get("tts_parameters", {})
-
-        # Extract default values safely
-        if hasattr(tts_params, 'voice'):
-            # Pydantic object
-            default_voice = tts_params.voice
-            default_speed = tts_params.speed
-            default_provider = tts_params.provider
-        elif isinstance(tts_params, dict):
-            # Dictionary
-            default_voice = tts_params.get('voice', "alloy")
-            default_speed = tts_params.get('speed', 1.0)
-            default_provider = tts_params.get('provider', "openai")
-        else:
-            # Default values
-            default_voice = "alloy"
-            default_speed = 1.0
-            default_provider = "openai"
-
-        # Use request parameters if provided, otherwise use config defaults
-        voice = request.voice or default_voice
-        speed = request.speed or default_speed
-        provider = request.provider or default_provider
-        model = request.model
-
-        # Handle system prompt for TTS
-        system_prompt = request.system_prompt
-        if not system_prompt and provider in ["gemini", "google"]:
-            # Use default TTS prompt if none provided for Gemini/Google
-            tts_prompts = models_config.get("system_prompts", {}).get("tts_prompts", {})
-            system_prompt = tts_prompts.get("default", "Read the text naturally with clear pronunciation")
-
-        # Apply system prompt logic based on provider
-        instructions = request.instructions
-        prompt_prefix = request.prompt_prefix
-
-        if provider == "openai":
-            # For OpenAI, use system_prompt as instructions if no instructions provided
-            if not instructions and system_prompt:
-                instructions = system_prompt
-        elif provider in ["gemini", "google"]:
-            # For Gemini, use system_prompt as prompt_prefix if no prompt_prefix provided
-            if not prompt_prefix and system_prompt:
-                prompt_prefix = system_prompt
-
-        # Convert text to speech using AI service
-        result = await ai_service.text_to_speech(
-            text=request.text,
-            voice=voice,
-            speed=speed,
-            provider=provider,
-            model=model,
-            instructions=instructions,
-            voice_config=request.voice_config,
-            prompt_prefix=prompt_prefix,
-            response_format=request.response_format
-        )
+        models_config = ConfigManager.load_models_config()
+        options = _resolve_tts_options(request, models_config)
+        result = await _synthesize(request, options)
 
-        return TTSResponse(
+        # Values come from the validated request and the AI service - skip re-validation
+        return TTSResponse.model_construct(
             success=result["success"],
             audio_base64=result.get("audio_base64", ""),
             audio_format=result.get("audio_format", ""),
             text=result.get("text", request.text),
-            voice=result.get("voice", voice),
+            voice=result.get("voice", options["voice"]),
             duration=result.get("duration", 0.0),
-            provider=provider,
-            model=result.get("model", model or ""),
-            speed=result.get("speed", speed),
-            system_prompt=system_prompt,
-            instructions=instructions,
-            prompt_prefix=prompt_prefix,
+            provider=options["provider"],
+            model=result.get("model", options["model"] or ""),
+            speed=result.get("speed", options["speed"]),
+            system_prompt=options["system_prompt"],
+            instructions=options["instructions"],
+            prompt_prefix=options["prompt_prefix"],
             language_code=request.language_code,
-            available_voices=models_config.get("voices", {}),
+            available_voices=models_config.get("voices", {}) if request.include_voices else {},
             error=result.get("error", "")
         )
 
@@ -141,4 +131,35 @@ async def text_to_audio(request: TTSRequest):
         raise HTTPException(
             status_code=500,
             detail=f"Error converting text to speech: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.post("/audio")
+async def text_to_audio_bytes(request: TTSRequest):
+    """Chuyển đổi text thành audio - trả về audio bytes trực tiếp (không base64)"""
+    try:
+        options = _resolve_tts_options(request, ConfigManager.load_models_config())
+        result = await _synthesize(request, options, encode_base64=False)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error converting text to speech: {str(e)}"
+        )
+
+    if not result["success"]:
+        raise HTTPException(status_code=502, detail=result.get("error", "Text to speech failed"))
+
+    audio_content = result.get("audio_content")
+    if audio_content is None:
+        # Providers that only return base64
+        audio_content = AudioUtils.decode_audio_base64(result.get("audio_base64", ""))
+
+    audio_format = result.get("audio_format") or request.response_format
+    return Response(
+        content=audio_content,
+        media_type=AudioUtils.get_mime_type_from_format(audio_format),
+        headers={
+            "X-Voice": str(result.get("voice", options["voice"])),
+            "X-Model": str(result.get("model", options["model"] or "")),
+            "X-Duration": str(result.get("duration", 0.0))
+        }
+    )
@@ -0,0 +1,16 @@
+"""
+Logging configuration - Single responsibility: Configure application logging once at startup
+"""
+import logging
+import os
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+def setup_logging(level: Optional[str] = None) -> None:
+    """Configure the root logger - level defaults to the LOG_LEVEL env var, then INFO"""
+    logging.basicConfig(
+        level=(level or os.getenv("LOG_LEVEL", "INFO")).upper(),
+        format=LOG_FORMAT
+    )
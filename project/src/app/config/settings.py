@@ -1,5 +1,8 @@
-from typing import Optional
+import os
+from typing import Any, Dict, Optional, Type, TypeVar
 from pathlib import Path
+from functools import cached_property, lru_cache
+from dotenv import dotenv_values
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -7,12 +10,37 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
 
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+
+@lru_cache(maxsize=1)
+def _read_env_file() -> Dict[str, Optional[str]]:
+    """Parse .env once for every settings section"""
+    return dotenv_values(ENV_FILE)
+
+
+def _load_section(cls: Type[SettingsT]) -> SettingsT:
+    """Build a settings section from the shared .env values plus the real environment
+
+    Keys already set in the process environment are left for pydantic-settings to read,
+    so real env vars keep taking precedence over .env.
+    """
+    prefix = cls.model_config.get("env_prefix", "").lower()
+    values: Dict[str, Any] = {}
+    for key, value in _read_env_file().items():
+        name = key.lower()
+        if value is None or key in os.environ or not name.startswith(prefix):
+            continue
+        field = name[len(prefix):]
+        if field in cls.model_fields:
+            values[field] = value
+    return cls(**values)
+
 
 class AuthSettings(BaseSettings):
     """Authentication settings"""
     model_config = SettingsConfigDict(
         env_prefix="SETTINGS__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -26,7 +54,6 @@ class OpenAISettings(BaseSettings):
     """OpenAI API settings"""
     model_config = SettingsConfigDict(
         env_prefix="OPENAI__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -42,7 +69,6 @@ class PostgresSettings(BaseSettings):
     """PostgreSQL database settings"""
     model_config = SettingsConfigDict(
         env_prefix="POSTGRES__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -55,13 +81,13 @@ class PostgresSettings(BaseSettings):
     limit: int = Field(default=100, description="Query result limit")
 
     @computed_field
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Generate database URL for SQLAlchemy"""
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.db}"
 
     @computed_field
-    @property
+    @cached_property
     def async_database_url(self) -> str:
         """Generate async database URL for SQLAlchemy"""
         return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.db}"
@@ -71,7 +97,6 @@ class QdrantSettings(BaseSettings):
     """Qdrant vector database settings"""
     model_config = SettingsConfigDict(
         env_prefix="QDRANT__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -80,7 +105,7 @@ class QdrantSettings(BaseSettings):
     port: int = Field(default=6333, description="Qdrant port")
 
     @computed_field
-    @property
+    @cached_property
     def url(self) -> str:
         """Generate Qdrant URL"""
         return f"http://{self.host}:{self.port}"
@@ -90,7 +115,6 @@ class MinioSettings(BaseSettings):
     """MinIO object storage settings"""
     model_config = SettingsConfigDict(
         env_prefix="MINIO__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -103,7 +127,7 @@ class MinioSettings(BaseSettings):
     debug: bool = Field(default=False, description="Enable debug mode")
 
     @computed_field
-    @property
+    @cached_property
     def endpoint(self) -> str:
         """Generate MinIO endpoint"""
         protocol = "https" if self.ssl else "http"
@@ -114,7 +138,6 @@ class RedisSettings(BaseSettings):
     """Redis cache settings"""
     model_config = SettingsConfigDict(
         env_prefix="REDIS__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -124,7 +147,7 @@ class RedisSettings(BaseSettings):
     db: int = Field(default=0, description="Redis database number")
 
     @computed_field
-    @property
+    @cached_property
     def url(self) -> str:
         """Generate Redis URL"""
         return f"redis://{self.host}:{self.port}/{self.db}"
@@ -134,7 +157,6 @@ class LangsmithSettings(BaseSettings):
     """LangSmith tracing settings"""
     model_config = SettingsConfigDict(
         env_prefix="LANGSMITH__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -145,7 +167,7 @@ class LangsmithSettings(BaseSettings):
     project: str = Field(..., description="LangSmith project name")
 
     @computed_field
-    @property
+    @cached_property
     def is_enabled(self) -> bool:
         """Check if tracing is enabled"""
         return self.tracing.lower() in ("true", "1", "yes", "on")
@@ -154,7 +176,6 @@ class GeminiSettings(BaseSettings):
     """Gemini API settings"""
     model_config = SettingsConfigDict(
         env_prefix="GEMINI__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -166,7 +187,6 @@ class GmailSettings(BaseSettings):
     """Gmail settings for NotebookLM automation"""
     model_config = SettingsConfigDict(
         env_prefix="GMAIL__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -179,7 +199,6 @@ class NotebookLMSettings(BaseSettings):
     """NotebookLM automation settings"""
     model_config = SettingsConfigDict(
         env_prefix="NOTEBOOKLM__",
-        env_file=str(ENV_FILE),
         case_sensitive=False,
         extra="ignore"
     )
@@ -193,8 +212,6 @@ class NotebookLMSettings(BaseSettings):
 class Settings(BaseSettings):
     """Main settings class that combines all configuration sections"""
     model_config = SettingsConfigDict(
-        env_file=str(ENV_FILE),
-        env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore"
     )
@@ -202,36 +219,60 @@ class Settings(BaseSettings):
     # App settings (direct field for BASE_URL)
     base_url: str = Field(default="http://localhost:8000", description="Application base URL")
     
-    # Nested settings (initialized after main settings)
-    auth: Optional[AuthSettings] = None
-    openai: Optional[OpenAISettings] = None
-    postgres: Optional[PostgresSettings] = None
-    qdrant: Optional[QdrantSettings] = None
-    minio: Optional[MinioSettings] = None
-    redis: Optional[RedisSettings] = None
-    langsmith: Optional[LangsmithSettings] = None
-    gemini: Optional[GeminiSettings] = None
-    gmail: Optional[GmailSettings] = None
-    notebooklm: Optional[NotebookLMSettings] = None
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Initialize nested settings after main settings
-        self.auth = AuthSettings()
-        self.openai = OpenAISettings()
-        self.postgres = PostgresSettings()
-        self.qdrant = QdrantSettings()
-        self.minio = MinioSettings()
-        self.redis = RedisSettings()
-        self.langsmith = LangsmithSettings()
-        self.gemini = GeminiSettings()
-        self.gmail = GmailSettings()
-        self.notebooklm = NotebookLMSettings()
+    # Nested settings - each section is built (and its env read) on first access only
+    @cached_property
+    def auth(self) -> AuthSettings:
+        return _load_section(AuthSettings)
+
+    @cached_property
+    def openai(self) -> OpenAISettings:
+        return _load_section(OpenAISettings)
+
+    @cached_property
+    def postgres(self) -> PostgresSettings:
+        return _load_section(PostgresSettings)
+
+    @cached_property
+    def qdrant(self) -> QdrantSettings:
+        return _load_section(QdrantSettings)
+
+    @cached_property
+    def minio(self) -> MinioSettings:
+        return _load_section(MinioSettings)
+
+    @cached_property
+    def redis(self) -> RedisSettings:
+        return _load_section(RedisSettings)
+
+    @cached_property
+    def langsmith(self) -> LangsmithSettings:
+        return _load_section(LangsmithSettings)
+
+    @cached_property
+    def gemini(self) -> GeminiSettings:
+        return _load_section(GeminiSettings)
+
+    @cached_property
+    def gmail(self) -> GmailSettings:
+        return _load_section(GmailSettings)
+
+    @cached_property
+    def notebooklm(self) -> NotebookLMSettings:
+        return _load_section(NotebookLMSettings)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance"""
+    return _load_section(Settings)
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 if __name__ == "__main__":
     import pprint
-    pprint.pprint(settings.model_dump())
\ No newline at end of file
+    pprint.pprint(settings.model_dump())
+    for section in ("auth", "openai", "postgres", "qdrant", "minio", "redis",
+                    "langsmith", "gemini", "gmail", "notebooklm"):
+        pprint.pprint({section: getattr(settings, section).model_dump()})
\ No newline at end of file
@@ -1,8 +1,9 @@
-from .ai_service import ai_service, AIService
+from .ai_service import get_ai_service, close_ai_service, AIService
 from .gemini_service import GeminiService
 
 __all__ = [
-    "ai_service",
+    "get_ai_service",
+    "close_ai_service",
     "AIService",
     "GeminiService"
 ]
\ No newline at end of file
@@ -1,57 +1,163 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 import os
-import base64
+import asyncio
+import copy
+import logging
 from datetime import datetime
+from types import MappingProxyType
+from functools import cached_property, lru_cache
+import httpx
 from ..config.settings import settings
 from .openai_tts_service import OpenAITTSService
+from ..utils.ttl_cache import TTLCache, generation_cache_key
 
-# Gemini import
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
-    genai = None
+logger = logging.getLogger(__name__)
 
-class AIService:
-    def __init__(self, api_key: Optional[str] = None):
-        if not GEMINI_AVAILABLE:
+# Gemini SDK - pulls in grpc/protobuf, so it is imported on first Gemini use only
+_genai_module = None
+
+def _import_genai():
+    global _genai_module
+    if _genai_module is None:
+        try:
+            import google.generativeai as genai
+        except ImportError:
             raise ImportError("Google Generative AI library not installed. Install with: pip install google-generativeai")
+        _genai_module = genai
+    return _genai_module
+
+@lru_cache(maxsize=1)
+def _default_gemini_key() -> Optional[str]:
+    """Gemini API key from settings > environment, resolved once per process"""
+    return (
+        getattr(settings.gemini, 'api_key', None) or
+        os.getenv("GEMINI_API_KEY") or
+        os.getenv("GEMINI__API_KEY")
+    )
+
+@lru_cache(maxsize=1)
+def _default_openai_key() -> Optional[str]:
+    """OpenAI API key from settings > environment, resolved once per process"""
+    return getattr(settings.openai, 'api_key', None) or os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI__API_KEY")
+
+@lru_cache(maxsize=64)
+def _generation_config(temperature: float, top_p: float, max_tokens: int):
+    """Shared GenerationConfig per sampling-parameter combination (treated as read-only)"""
+    return _import_genai().types.GenerationConfig(
+        temperature=temperature,
+        top_p=top_p,
+        max_output_tokens=max_tokens,
+    )
+
+# Gemini attachment size limits
+_MAX_PDF_SIZE = 50 * 1024 * 1024      # File API limit
+_MAX_IMAGE_SIZE = 20 * 1024 * 1024    # Largest image accepted
+_INLINE_LIMIT = 4 * 1024 * 1024       # Larger PDFs/images are streamed from disk via the File API
+
+# How each attachment MIME type is sent to Gemini; other text/* types are also "text"
+_MIME_KINDS = {
+    'application/pdf': 'pdf',
+    'image/jpeg': 'image',
+    'image/png': 'image',
+    'image/gif': 'image',
+    'image/webp': 'image',
+    'application/json': 'text',
+    'text/csv': 'text',
+    'text/plain': 'text'
+}
+
+def _read_bytes(file_path: str) -> bytes:
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+def _read_text(file_path: str) -> str:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+# Static capability listing returned by AIService.get_available_models (read-only)
+_AVAILABLE_MODELS = MappingProxyType({
+    "text_generation": [
+        "gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash", "gemini-1.0-pro"
+    ],
+    "document_processing": [
+        "gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash"
+    ],
+    "supported_formats": {
+        "documents": ["application/pdf"],
+        "images": ["image/jpeg", "image/png", "image/gif", "image/webp"],
+        "text": ["text/plain", "text/csv", "application/json"]
+    },
+    "limits": {
+        "inline_file_size": f"{_INLINE_LIMIT // (1024 * 1024)}MB",
+        "file_api_size": f"{_MAX_PDF_SIZE // (1024 * 1024)}MB",
+        "pdf_pages": "1000 pages"
+    }
+})
 
+class AIService:
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: int = 50,
+                 cache_enabled: bool = False):
         # Try to get Gemini API key from: parameter > settings > environment
-        self.api_key = (
-            api_key or
-            getattr(settings.gemini, 'api_key', None) or
-            os.getenv("GEMINI_API_KEY") or
-            os.getenv("GEMINI__API_KEY")
-        )
+        self.api_key = api_key or _default_gemini_key()
         if not self.api_key:
             raise ValueError("Gemini API key is required")
 
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        # Upper bound on in-flight Gemini calls for batch generation
+        self._max_concurrency = max_concurrency
+
+        # Opt-in exact-match cache for deterministic (temperature == 0) generate_text calls
+        self._cache_enabled = cache_enabled
+        self._response_cache = TTLCache(maxsize=256, ttl=600)
+
+        # Keep-alive connection pool shared by the HTTP-based provider clients
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
 
         # Initialize OpenAI TTS service if API key is available
         self.openai_tts_service = None
         try:
-            openai_key = getattr(settings.openai, 'api_key', None) or os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI__API_KEY")
+            openai_key = _default_openai_key()
             if openai_key:
-                self.openai_tts_service = OpenAITTSService(openai_key)
+                self.openai_tts_service = OpenAITTSService(openai_key, http_client=self._http_client)
         except Exception:
             pass
 
+    @cached_property
+    def genai(self):
+        """google.generativeai, imported and configured on first use"""
+        genai = _import_genai()
+        genai.configure(api_key=self.api_key)
+        return genai
+
+    @cached_property
+    def model(self):
+        """Gemini model, built on first use"""
+        return self.genai.GenerativeModel('gemini-2.0-flash-exp')
+
+    async def aclose(self) -> None:
+        """Release pooled HTTP connections - call once at application shutdown"""
+        await self._http_client.aclose()
+
     async def generate_text_with_files(self, prompt: str, files: list = None, model: str = "gemini-2.0-flash-exp",
                                      system_prompt: str = "", temperature: float = 0.7,
                                      top_p: float = 0.9, max_tokens: int = 100) -> Dict[str, Any]:
         """Generate text with file attachments using Gemini document processing"""
+        logger.debug("generate_text_with_files: model=%s files=%d", model, len(files) if files else 0)
         try:
-            # Prepare content for Gemini
+            # Prepare content for Gemini - consecutive text fragments are merged into one part
             content_parts = []
+            text_buf: List[str] = []
+
+            def flush_text():
+                if text_buf:
+                    content_parts.append("".join(text_buf))
+                    text_buf.clear()
 
             # Add system prompt if provided
             if system_prompt:
-                content_parts.append(f"System: {system_prompt}\n\n")
+                text_buf.append(f"System: {system_prompt}\n\n")
 
             # Process files if provided
             if files:
@@ -61,84 +167,85 @@ class AIService:
                     filename = file_info.get('filename', '')
 
                     if not file_path or not os.path.exists(file_path):
-                        print(f"Warning: File path not found for {filename}")
+                        logger.warning("File path not found for %s", filename)
                         continue
 
+                    kind = _MIME_KINDS.get(mime_type) or ('text' if mime_type.startswith('text/') else 'other')
+
                     try:
-                        if mime_type == 'application/pdf':
+                        if kind == 'pdf':
                             # Handle PDF using Gemini's document processing
-                            with open(file_path, 'rb') as f:
-                                pdf_data = f.read()
+                            pdf_size = os.path.getsize(file_path)
 
                             # Check file size (max 50MB for Gemini File API)
-                            if len(pdf_data) > 50 * 1024 * 1024:
-                                content_parts.append(f"\n\n--- File: {filename} ---\nPDF file too large (>50MB). Please use a smaller file.")
+                            if pdf_size > _MAX_PDF_SIZE:
+                                text_buf.append(f"\n\n--- File: {filename} ---\nPDF file too large (>50MB). Please use a smaller file.")
                                 continue
 
-                            # For files under 20MB, use inline data
-                            if len(pdf_data) <= 20 * 1024 * 1024:
-                                # Upload inline PDF data
-                                pdf_base64 = base64.b64encode(pdf_data).decode('utf-8')
+                            # Small PDFs go inline as raw bytes (the SDK does the wire encoding)
+                            if pdf_size <= _INLINE_LIMIT:
+                                pdf_data = await asyncio.to_thread(_read_bytes, file_path)
+                                flush_text()
                                 content_parts.append({
                                     "inline_data": {
                                         "mime_type": "application/pdf",
-                                        "data": pdf_base64
+                                        "data": pdf_data
                                     }
                                 })
                             else:
-                                # Use File API for larger files
-                                uploaded_file = genai.upload_file(file_path, mime_type=mime_type)
+                                # Use File API for larger files - streams from disk, off the event loop
+                                uploaded_file = await asyncio.to_thread(self.genai.upload_file, file_path, mime_type=mime_type)
+                                flush_text()
                                 content_parts.append(uploaded_file)
 
-                        elif mime_type.startswith('image/') and mime_type in ['image/jpeg', 'image/png', 'image/gif', 'image/webp']:
-                            # Handle images
-                            with open(file_path, 'rb') as f:
-                                image_data = f.read()
-
-                            # Check file size (max 20MB for inline)
-                            if len(image_data) > 20 * 1024 * 1024:
-                                content_parts.append(f"\n\n--- File: {filename} ---\nImage file too large (>20MB). Please use a smaller image.")
+                        elif kind == 'image':
+                            # Handle images - check file size (max 20MB) before reading
+                            image_size = os.path.getsize(file_path)
+                            if image_size > _MAX_IMAGE_SIZE:
+                                text_buf.append(f"\n\n--- File: {filename} ---\nImage file too large (>20MB). Please use a smaller image.")
                                 continue
 
-                            image_base64 = base64.b64encode(image_data).decode('utf-8')
-                            content_parts.append({
-                                "inline_data": {
-                                    "mime_type": mime_type,
-                                    "data": image_base64
-                                }
-                            })
+                            # Small images go inline as raw bytes, larger ones through the File API
+                            if image_size <= _INLINE_LIMIT:
+                                image_data = await asyncio.to_thread(_read_bytes, file_path)
+                                flush_text()
+                                content_parts.append({
+                                    "inline_data": {
+                                        "mime_type": mime_type,
+                                        "data": image_data
+                                    }
+                                })
+                            else:
+                                uploaded_file = await asyncio.to_thread(self.genai.upload_file, file_path, mime_type=mime_type)
+                                flush_text()
+                                content_parts.append(uploaded_file)
 
-                        elif mime_type.startswith('text/') or mime_type in ['application/json', 'text/csv', 'text/plain']:
+                        elif kind == 'text':
                             # Handle text files
                             try:
-                                with open(file_path, 'r', encoding='utf-8') as f:
-                                    text_content = f.read()
-                                content_parts.append(f"\n\n--- File: {filename} ({mime_type}) ---\n{text_content}")
+                                text_content = await asyncio.to_thread(_read_text, file_path)
+                                text_buf.append(f"\n\n--- File: {filename} ({mime_type}) ---\n{text_content}")
                             except Exception as e:
-                                content_parts.append(f"\n\n--- File: {filename} ---\nError reading text file: {str(e)}")
+                                text_buf.append(f"\n\n--- File: {filename} ---\nError reading text file: {str(e)}")
 
                         else:
                             # For other file types, provide basic info
-                            with open(file_path, 'rb') as f:
-                                file_size = len(f.read())
-                            content_parts.append(f"\n\n--- File: {filename} ({mime_type}) ---\nFile size: {file_size} bytes. Gemini supports PDF documents and images natively. For other file types, please convert to PDF or extract text content.")
+                            file_size = os.path.getsize(file_path)
+                            text_buf.append(f"\n\n--- File: {filename} ({mime_type}) ---\nFile size: {file_size} bytes. Gemini supports PDF documents and images natively. For other file types, please convert to PDF or extract text content.")
 
                     except Exception as file_error:
-                        print(f"Error processing file {filename}: {file_error}")
-                        content_parts.append(f"\n\n--- File: {filename} ---\nError processing this file: {str(file_error)}")
+                        logger.warning("Error processing file %s: %s", filename, file_error)
+                        text_buf.append(f"\n\n--- File: {filename} ---\nError processing this file: {str(file_error)}")
 
             # Add user prompt
-            content_parts.append(f"\n\nUser: {prompt}")
+            text_buf.append(f"\n\nUser: {prompt}")
+            flush_text()
 
             # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                top_p=top_p,
-                max_output_tokens=max_tokens,
-            )
+            generation_config = _generation_config(temperature, top_p, max_tokens)
 
-            # Generate response
-            response = self.model.generate_content(
+            # Generate response (async client call - does not block the event loop)
+            response = await self.model.generate_content_async(
                 content_parts,
                 generation_config=generation_config
             )
@@ -167,11 +274,39 @@ class AIService:
                            system_prompt: str = "", temperature: float = 0.7,
                            top_p: float = 0.9, max_tokens: int = 100) -> Dict[str, Any]:
         """Generate text using Gemini models"""
-        return await self.generate_text_with_files(
+        cache_key = None
+        if self._cache_enabled and temperature == 0:
+            cache_key = generation_cache_key(prompt, model, system_prompt, temperature, top_p, max_tokens)
+            cached_result = self._response_cache.get(cache_key)
+            if cached_result is not None:
+                # Hand out a copy so callers can't corrupt the cached entry
+                return {**copy.deepcopy(cached_result), "timestamp": datetime.now().isoformat()}
+
+        result = await self.generate_text_with_files(
             prompt=prompt, files=None, model=model, system_prompt=system_prompt,
             temperature=temperature, top_p=top_p, max_tokens=max_tokens
         )
 
+        if cache_key and result["success"]:
+            self._response_cache.set(cache_key, copy.deepcopy(result))
+        return result
+
+    async def generate_text_batch(self, prompts: List[str], model: str = "gemini-2.0-flash-exp",
+                                  system_prompt: str = "", temperature: float = 0.7,
+                                  top_p: float = 0.9, max_tokens: int = 100) -> List[Dict[str, Any]]:
+        """Generate text for several prompts concurrently, results in prompt order"""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def generate_one(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_text(
+                    prompt=prompt, model=model, system_prompt=system_prompt,
+                    temperature=temperature, top_p=top_p, max_tokens=max_tokens
+                )
+
+        # generate_text reports failures in its result dict, so one bad prompt doesn't cancel the rest
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts))
+
     async def generate_text_stream(self, prompt: str, model: str = "gemini-2.0-flash-exp",
                                   system_prompt: str = "", temperature: float = 0.7,
                                   top_p: float = 0.9, max_tokens: int = 100) -> Dict[str, Any]:
@@ -188,14 +323,10 @@ class AIService:
             content_parts.append(f"User: {prompt}")
 
             # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                top_p=top_p,
-                max_output_tokens=max_tokens,
-            )
+            generation_config = _generation_config(temperature, top_p, max_tokens)
 
-            # Generate streaming response
-            response = self.model.generate_content(
+            # Generate streaming response (async iterator - waiting for chunks doesn't block the loop)
+            response = await self.model.generate_content_async(
                 content_parts,
                 generation_config=generation_config,
                 stream=True
@@ -203,7 +334,7 @@ class AIService:
 
             async def stream_generator():
                 """Generator function for streaming chunks"""
-                for chunk in response:
+                async for chunk in response:
                     if chunk.text:
                         yield chunk.text
 
@@ -226,34 +357,21 @@ class AIService:
                 "timestamp": datetime.now().isoformat()
             }
 
-    def get_available_models(self) -> Dict[str, Any]:
+    def get_available_models(self) -> Mapping[str, Any]:
         """Get available Gemini models"""
-        return {
-            "text_generation": [
-                "gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash", "gemini-1.0-pro"
-            ],
-            "document_processing": [
-                "gemini-2.0-flash-exp", "gemini-1.5-pro", "gemini-1.5-flash"
-            ],
-            "supported_formats": {
-                "documents": ["application/pdf"],
-                "images": ["image/jpeg", "image/png", "image/gif", "image/webp"],
-                "text": ["text/plain", "text/csv", "application/json"]
-            },
-            "limits": {
-                "inline_file_size": "20MB",
-                "file_api_size": "50MB",
-                "pdf_pages": "1000 pages"
-            }
-        }
+        return _AVAILABLE_MODELS
 
     async def text_to_speech(self, text: str, voice: str = "alloy",
                             speed: float = 1.0, provider: str = "openai",
                             model: str = None, instructions: str = "",
                             voice_config: Dict[str, Any] = None,
                             prompt_prefix: str = "",
-                            response_format: str = "mp3") -> Dict[str, Any]:
-        """Convert text to speech using OpenAI TTS"""
+                            response_format: str = "mp3",
+                            encode_base64: bool = True) -> Dict[str, Any]:
+        """Convert text to speech using OpenAI TTS
+
+        encode_base64=False skips building audio_base64 for callers that use audio_content directly.
+        """
 
         if provider == "openai":
             if not self.openai_tts_service:
@@ -262,9 +380,22 @@ class AIService:
             tts_model = model or ("tts-1-hd" if "hd" in voice.lower() else "tts-1")
             return await self.openai_tts_service.text_to_speech(
                 text=text, voice=voice, model=tts_model, speed=speed,
-                instructions=instructions, response_format=response_format)
+                instructions=instructions, response_format=response_format,
+                encode_base64=encode_base64)
         else:
             return {"success": False, "error": f"TTS provider '{provider}' not supported"}
 
-# Global instance
-ai_service = AIService()
\ No newline at end of file
+# Global instance - created on first use so importing the app doesn't configure the providers
+_ai_service: Optional[AIService] = None
+
+def get_ai_service() -> AIService:
+    """Return the shared AIService, creating it on first call"""
+    global _ai_service
+    if _ai_service is None:
+        _ai_service = AIService(cache_enabled=True)
+    return _ai_service
+
+async def close_ai_service() -> None:
+    """Close the shared AIService if it was ever created"""
+    if _ai_service is not None:
+        await _ai_service.aclose()
\ No newline at end of file
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional
 import os
 from datetime import datetime
 from ..config.settings import settings
+from ..utils.audio_utils import AudioUtils
 
 # OpenAI import for TTS only
 try:
@@ -14,7 +15,7 @@ except ImportError:
 class OpenAITTSService:
     """OpenAI Text-to-Speech service only"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[Any] = None):
         if not OPENAI_AVAILABLE:
             raise ImportError("OpenAI library not installed. Install with: pip install openai")
 
@@ -28,12 +29,19 @@ class OpenAITTSService:
         if not self.api_key:
             raise ValueError("OpenAI API key is required for TTS")
 
-        # Configure OpenAI client
-        self.client = openai.OpenAI(api_key=self.api_key)
+        # Configure async OpenAI client - reuses the caller's connection pool when given one
+        self.client = openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+        self._owns_http_client = http_client is None
+
+    async def aclose(self) -> None:
+        """Close the OpenAI client - an injected http_client is left open for its owner"""
+        if self._owns_http_client:
+            await self.client.close()
 
     async def text_to_speech(self, text: str, voice: str = "alloy",
                              model: str = "tts-1", speed: float = 1.0,
-                             instructions: str = "", response_format: str = "mp3") -> Dict[str, Any]:
+                             instructions: str = "", response_format: str = "mp3",
+                             encode_base64: bool = True) -> Dict[str, Any]:
         """Convert text to speech using OpenAI TTS"""
         try:
             # Validate inputs
@@ -49,7 +57,7 @@ class OpenAITTSService:
                 }
 
             # OpenAI TTS call
-            response = self.client.audio.speech.create(
+            response = await self.client.audio.speech.create(
                 model=model,
                 voice=voice,
                 input=text,
@@ -60,9 +68,8 @@ class OpenAITTSService:
             # Get audio content
             audio_content = response.content
             
-            # Convert to base64 for consistent API response
-            import base64
-            audio_base64 = base64.b64encode(audio_content).decode('utf-8')
+            # Convert to base64 for consistent API response (skipped for raw-audio callers)
+            audio_base64 = AudioUtils.encode_audio_base64(audio_content) if encode_base64 else ""
 
             return {
                 "success": True,
@@ -1,18 +1,32 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from .api import config_router, generate_router, tts_router
 from .api.models import router as models_router
 from .api.notebooklm import router as notebooklm_router
+from .core import close_ai_service
+from .config.loggings import setup_logging
+from .utils.gzip_middleware import SelectiveGZipMiddleware
 from dotenv import load_dotenv
 import os
 
 # Load environment variables from .env file
 load_dotenv()
+setup_logging()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the AI service's pooled HTTP connections
+    await close_ai_service()
 
 app = FastAPI(
     title="Text-to-Speech & Text Generation API",
     description="API cho text generation và text-to-speech với user customization",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -24,6 +38,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (config, model listings, base64 audio); raw audio/* is already compressed
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024)
+
 # Include routers with /api prefix
 app.include_router(config_router, prefix="/api")
 app.include_router(generate_router, prefix="/api")
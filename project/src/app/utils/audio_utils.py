@@ -7,6 +7,14 @@ import io
 import mimetypes
 from typing import Dict, Any, Optional, Union
 
+# SIMD-accelerated base64 when available (same API as the stdlib module)
+try:
+    import pybase64 as _base64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    _base64 = base64
+    PYBASE64_AVAILABLE = False
+
 
 class AudioUtils:
     """Utilities for audio processing operations"""
@@ -16,7 +24,7 @@ class AudioUtils:
         """Convert audio data to base64 string"""
         try:
             if isinstance(audio_data, (bytes, bytearray)):
-                return base64.b64encode(audio_data).decode('utf-8')
+                return _base64.b64encode(audio_data).decode('ascii')
             else:
                 raise TypeError("Audio data must be bytes or bytearray")
         except Exception as e:
@@ -26,7 +34,7 @@ class AudioUtils:
     def decode_audio_base64(audio_base64: str) -> bytes:
         """Convert base64 string back to audio bytes"""
         try:
-            return base64.b64decode(audio_base64)
+            return _base64.b64decode(audio_base64)
         except Exception as e:
             raise ValueError(f"Failed to decode base64 audio: {e}")
 
@@ -91,7 +99,7 @@ class AudioUtils:
     def create_audio_blob_url(audio_base64: str, audio_format: str = 'mp3') -> Dict[str, Any]:
         """Create blob URL info for audio data"""
         mime_type = AudioUtils.get_mime_type_from_format(audio_format)
-        audio_size = len(base64.b64decode(audio_base64))
+        audio_size = len(_base64.b64decode(audio_base64))
 
         return {
             "base64": audio_base64,
@@ -3,31 +3,79 @@ Configuration Manager - Single responsibility: Load and manage configuration fil
 Consolidates 6 duplicate config loading implementations
 """
 import json
+import logging
 import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# models.json location, resolved once at import (independent of the working directory)
+_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "models.json"
+_CONFIG_PATH_STR = str(_CONFIG_PATH)
+
+
+@lru_cache(maxsize=4)
+def _load_json_file(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file - cached per (path, mtime) so edits are picked up"""
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Returned (always the same object) while models.json is missing or invalid
+_EMPTY_CONFIG: Dict[str, Any] = {}
+
+# Missing config paths - not retried; restart the server after adding models.json
+_missing_paths = set()
+
+# Invalid config files by path -> mtime_ns of the bad version, retried once the file changes
+_invalid_mtimes: Dict[str, int] = {}
+
 
 class ConfigManager:
     """Single source of truth for all configuration loading"""
 
     @staticmethod
     def load_models_config() -> Dict[str, Any]:
-        """Load models configuration from models.json file"""
+        """Load models configuration from models.json file
+
+        The parsed result is shared between callers and must not be mutated.
+        """
+        config_path = ConfigManager.get_config_path()
+        if config_path in _missing_paths:
+            return _EMPTY_CONFIG
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning("models.json not found at %s", config_path)
+            _missing_paths.add(config_path)
+            return _EMPTY_CONFIG
+
+        if _invalid_mtimes.get(config_path) == mtime_ns:
+            return _EMPTY_CONFIG
         try:
-            config_path = os.path.join(
-                os.path.dirname(__file__), "..", "config", "models.json"
-            )
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json_file(config_path, mtime_ns)
         except FileNotFoundError:
-            print(f"Warning: models.json not found at {config_path}")
-            return {}
-        except json.JSONDecodeError as e:
-            print(f"Warning: Invalid JSON in models.json: {e}")
-            return {}
-        except Exception as e:
-            print(f"Warning: Could not load models config: {e}")
-            return {}
+            # Removed between stat and open
+            logger.warning("models.json not found at %s", config_path)
+            _missing_paths.add(config_path)
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+            logger.warning("Invalid JSON in models.json: %s", e)
+            _invalid_mtimes[config_path] = mtime_ns
+        return _EMPTY_CONFIG
 
     @staticmethod
     def get_system_prompts(category: str = "default") -> Dict[str, str]:
@@ -55,9 +103,7 @@ class ConfigManager:
     @staticmethod
     def get_config_path() -> str:
         """Get the path to models.json file"""
-        return os.path.join(
-            os.path.dirname(__file__), "..", "config", "models.json"
-        )
+        return _CONFIG_PATH_STR
 
     @staticmethod
     def is_config_valid() -> bool:
@@ -1,11 +1,23 @@
 import os
+import time
 import uuid
 import base64
 import tempfile
 from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 import mimetypes
 import io
+from functools import lru_cache
+
+# Load the MIME database up front instead of on the first request
+mimetypes.init()
+
+
+@lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> str:
+    """Guess MIME type from a lowercase file extension (e.g. '.pdf')"""
+    return mimetypes.guess_type("x" + ext)[0] or 'application/octet-stream'
+
 
 class FileHandler:
     """Utility class for handling file uploads and conversions for AI services"""
@@ -56,8 +68,7 @@ class FileHandler:
 
             # Detect mime type if not provided
             if not mime_type:
-                mime_type, _ = mimetypes.guess_type(filename)
-                mime_type = mime_type or 'application/octet-stream'
+                mime_type = _mime_for_ext(file_extension.lower())
 
             return {
                 'success': True,
@@ -82,16 +93,13 @@ class FileHandler:
     def cleanup_old_files(self):
         """Remove files older than cleanup_after_hours"""
         try:
-            current_time = datetime.now()
-            cutoff_time = current_time - timedelta(hours=self.cleanup_after_hours)
+            cutoff_time = time.time() - self.cleanup_after_hours * 3600
 
-            for filename in os.listdir(self.static_folder):
-                file_path = os.path.join(self.static_folder, filename)
-                if os.path.isfile(file_path):
-                    file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    if file_mtime < cutoff_time:
-                        os.remove(file_path)
-                        print(f"Cleaned up old file: {filename}")
+            with os.scandir(self.static_folder) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        print(f"Cleaned up old file: {entry.name}")
 
         except Exception as e:
             print(f"Error during file cleanup: {e}")
@@ -99,18 +107,17 @@ class FileHandler:
     def get_file_info(self, file_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a saved file by ID"""
         try:
-            for filename in os.listdir(self.static_folder):
-                if filename.startswith(file_id):
-                    file_path = os.path.join(self.static_folder, filename)
-                    if os.path.exists(file_path):
-                        stat = os.stat(file_path)
-                        mime_type, _ = mimetypes.guess_type(filename)
+            with os.scandir(self.static_folder) as entries:
+                for entry in entries:
+                    if entry.name.startswith(file_id) and entry.is_file():
+                        stat = entry.stat()
+                        mime_type = _mime_for_ext(os.path.splitext(entry.name)[1].lower())
 
                         return {
                             'file_id': file_id,
-                            'filename': filename,
-                            'file_path': file_path,
-                            'mime_type': mime_type or 'application/octet-stream',
+                            'filename': entry.name,
+                            'file_path': entry.path,
+                            'mime_type': mime_type,
                             'file_size': stat.st_size,
                             'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                             'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -123,11 +130,10 @@ class FileHandler:
     def delete_file(self, file_id: str) -> bool:
         """Delete a file by ID"""
         try:
-            for filename in os.listdir(self.static_folder):
-                if filename.startswith(file_id):
-                    file_path = os.path.join(self.static_folder, filename)
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
+            with os.scandir(self.static_folder) as entries:
+                for entry in entries:
+                    if entry.name.startswith(file_id) and entry.is_file():
+                        os.remove(entry.path)
                         return True
             return False
         except Exception as e:
@@ -0,0 +1,53 @@
+"""
+GZip Middleware - Single responsibility: Compress responses except already-compressed media
+Wraps Starlette's GZipMiddleware so audio/* bodies (mp3, opus, aac...) are sent as-is
+"""
+from typing import Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# GZipMiddleware passes through responses that already declare a Content-Encoding,
+# so excluded responses are tagged with this header and it is removed again on the way out
+_PASSTHROUGH_HEADER = (b"content-encoding", b"identity")
+
+
+class SelectiveGZipMiddleware:
+    """GZipMiddleware that skips responses whose media type starts with an excluded prefix"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9,
+                 excluded_media_types: Tuple[str, ...] = ("audio/",)) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.excluded_media_types = excluded_media_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tagged = False
+
+        async def app_with_tagging(scope: Scope, receive: Receive, gzip_send: Send) -> None:
+            async def send_tagged(message: Message) -> None:
+                nonlocal tagged
+                if message["type"] == "http.response.start":
+                    headers = Headers(raw=message["headers"])
+                    if ("content-encoding" not in headers and
+                            headers.get("content-type", "").startswith(self.excluded_media_types)):
+                        tagged = True
+                        message["headers"] = [*message["headers"], _PASSTHROUGH_HEADER]
+                await gzip_send(message)
+
+            await self.app(scope, receive, send_tagged)
+
+        async def send_untagged(message: Message) -> None:
+            if tagged and message["type"] == "http.response.start":
+                message["headers"] = [h for h in message["headers"] if tuple(h) != _PASSTHROUGH_HEADER]
+            await send(message)
+
+        gzip_app = GZipMiddleware(app_with_tagging, minimum_size=self.minimum_size,
+                                  compresslevel=self.compresslevel)
+        await gzip_app(scope, receive, send_untagged)
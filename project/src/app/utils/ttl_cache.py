@@ -0,0 +1,62 @@
+"""
+TTL Cache - Single responsibility: Small in-process cache with per-entry expiry
+Used from the event loop only, so no locking is done
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire ttl seconds after being stored"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries when full"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove an entry and return its value"""
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def generation_cache_key(prompt: str, model: str, system_prompt: str, temperature: float,
+                         top_p: float, max_tokens: int) -> str:
+    """Hash text-generation parameters into a compact cache key
+
+    Surrounding whitespace is ignored so trivially different submissions share an entry.
+    """
+    params = json.dumps([model, system_prompt.strip(), prompt.strip(), temperature, top_p, max_tokens],
+                        ensure_ascii=False)
+    return hashlib.sha256(params.encode('utf-8')).hexdigest()